@@ -1,10 +1,67 @@
 from __future__ import annotations
+import copy
+from functools import lru_cache
 import pybamm
 from .step.base_step import (
     _convert_time_to_seconds,
     _convert_temperature_to_kelvin,
 )
 
+# Units that can be given for each type of experiment termination
+_CAPACITY_UNITS = ("%", "Ah")
+_TIME_UNITS = (
+    "hour",
+    "hours",
+    "h",
+    "hr",
+    "minute",
+    "minutes",
+    "m",
+    "min",
+    "second",
+    "seconds",
+    "s",
+    "sec",
+)
+
+
+@lru_cache(maxsize=512)
+def _parse_termination(termination):
+    """
+    Parse a tuple of termination strings into a dictionary of termination conditions.
+    Results are cached, as the same termination is typically reused across many
+    experiments (e.g. when copying or in parameter sweeps).
+    """
+    termination_dict = {}
+    for term in termination:
+        # Voltage is the cheapest to identify, so check it before splitting the term
+        if term.endswith("V"):
+            termination_dict["voltage"] = (float(term[:-1]), "V")
+            continue
+
+        # Split off the last word on any whitespace; head is empty for a single word
+        *head, tail = term.rsplit(maxsplit=1) or [""]
+        if tail == "capacity":
+            end_discharge = "".join("".join(head).split()).replace("A.h", "Ah")
+            for unit in _CAPACITY_UNITS:
+                if end_discharge.endswith(unit):
+                    capacity = float(end_discharge[: -len(unit)])
+                    termination_dict["capacity"] = (capacity, unit)
+                    break
+            else:
+                raise ValueError(
+                    "Capacity termination must be given in the form "
+                    "'80%', '4Ah', or '4A.h'"
+                )
+        elif term.endswith(_TIME_UNITS):
+            termination_dict["time"] = _convert_time_to_seconds(term)
+        else:
+            raise ValueError(
+                "Only capacity, voltage or time can be provided as a termination "
+                "reason, e.g. '80% capacity', '4 Ah capacity', '2.5 V' or '1 hour'"
+            )
+    return termination_dict
+
 
 class Experiment:
     """
@@ -52,15 +109,19 @@ class Experiment:
             termination,
         )
 
+        # Unpack the cycles, recording their lengths and the flattened list of steps
+        # in a single pass
         cycles = []
+        cycle_lengths = []
+        steps_unprocessed = []
         for cycle in operating_conditions:
             if not isinstance(cycle, tuple):
                 cycle = (cycle,)
             cycles.append(cycle)
+            cycle_lengths.append(len(cycle))
+            steps_unprocessed.extend(cycle)
         self.cycles = cycles
-        self.cycle_lengths = [len(cycle) for cycle in cycles]
-
-        steps_unprocessed = [cond for cycle in cycles for cond in cycle]
+        self.cycle_lengths = cycle_lengths
 
         # Convert strings to pybamm.step.BaseStep objects
         # We only do this once per unique step, to avoid unnecessary conversions
@@ -75,9 +136,12 @@ class Experiment:
         self.steps = [processed_steps[repr(step)] for step in steps_unprocessed]
         self.steps = self._set_next_start_time(self.steps)
 
-        # Save the processed unique steps and the processed operating conditions
-        # for every step
-        self.unique_steps = set(processed_steps.values())
+        # Save the processed unique steps, in the order in which they first appear.
+        # These are only iterated over, so store them as an immutable tuple
+        self.unique_steps = tuple(dict.fromkeys(processed_steps.values()))
+
+        # Map each tag to the cycles in which it appears, for lookup in search_tag
+        self._tag_index = self._build_tag_index(self.steps, self.cycle_lengths)
 
         # Allocate experiment global variables
         self.initial_start_time = self.steps[0].start_time
@@ -93,25 +157,30 @@ class Experiment:
 
     @staticmethod
     def process_steps(unprocessed_steps, period, temp):
+        # Look up the step constructors once rather than on every iteration
+        string, BaseStep = pybamm.step.string, pybamm.step.BaseStep
+
         processed_steps = {}
         for step in unprocessed_steps:
-            if repr(step) in processed_steps:
+            step_repr = repr(step)
+            if step_repr in processed_steps:
                 continue
             elif isinstance(step, str):
-                processed_step = pybamm.step.string(step)
-            elif isinstance(step, pybamm.step.BaseStep):
+                processed_step = string(step)
+            elif isinstance(step, BaseStep):
                 # Copy the step to avoid modifying the original with the period and
                 # temperature and any other changes
                 processed_step = step.copy()
             else:
                 raise TypeError("Operating conditions must be a Step object or string.")
 
-            if processed_step.period is None:
+            # Only fill in the defaults that are actually set
+            if period is not None and processed_step.period is None:
                 processed_step.period = period
-            if processed_step.temperature is None:
+            if temp is not None and processed_step.temperature is None:
                 processed_step.temperature = temp
 
-            processed_steps[repr(step)] = processed_step
+            processed_steps[step_repr] = processed_step
 
         return processed_steps
 
@@ -119,7 +188,17 @@ class Experiment:
         return str(self.cycles)
 
     def copy(self):
-        return Experiment(*self.args)
+        """
+        Return a copy of the experiment. The processed steps are shared with the
+        original rather than being parsed again, as they are not modified once the
+        experiment has been created.
+        """
+        new_experiment = copy.copy(self)
+        new_experiment.cycles = self.cycles.copy()
+        new_experiment.cycle_lengths = self.cycle_lengths.copy()
+        new_experiment.steps = self.steps.copy()
+        new_experiment.termination = self.termination.copy()
+        return new_experiment
 
     def __repr__(self):
         return f"pybamm.Experiment({self!s})"
@@ -133,15 +212,15 @@ class Experiment:
         ----------
         termination : str or list[str], optional
            A single string, or a list of strings, representing the conditions to terminate the experiment.
-           Only capacity or voltage can be provided as a termination reason.
-           e.g. '4 Ah capacity' or ['80% capacity', '2.5 V']
+           Only capacity, voltage or time can be provided as a termination reason.
+           e.g. '4 Ah capacity' or ['80% capacity', '2.5 V', '1 hour']
 
         Returns
         -------
         dict
            A dictionary of the termination conditions.
            e.g. {'capacity': (4.0, 'Ah')} or
-           {'capacity': (80.0, '%'), 'voltage': (2.5, 'V')}
+           {'capacity': (80.0, '%'), 'voltage': (2.5, 'V'), 'time': 3600.0}
 
         """
         if termination is None:
@@ -149,52 +228,8 @@ class Experiment:
         elif isinstance(termination, str):
             termination = [termination]
 
-        termination_dict = {}
-        for term in termination:
-            term_list = term.split()
-            if term_list[-1] == "capacity":
-                end_discharge = "".join(term_list[:-1])
-                end_discharge = end_discharge.replace("A.h", "Ah")
-                if end_discharge.endswith("%"):
-                    end_discharge_percent = end_discharge.split("%")[0]
-                    termination_dict["capacity"] = (float(end_discharge_percent), "%")
-                elif end_discharge.endswith("Ah"):
-                    end_discharge_Ah = end_discharge.split("Ah")[0]
-                    termination_dict["capacity"] = (float(end_discharge_Ah), "Ah")
-                else:
-                    raise ValueError(
-                        "Capacity termination must be given in the form "
-                        "'80%', '4Ah', or '4A.h'"
-                    )
-            elif term.endswith("V"):
-                end_discharge_V = term.split("V")[0]
-                termination_dict["voltage"] = (float(end_discharge_V), "V")
-            elif any(
-                [
-                    term.endswith(key)
-                    for key in [
-                        "hour",
-                        "hours",
-                        "h",
-                        "hr",
-                        "minute",
-                        "minutes",
-                        "m",
-                        "min",
-                        "second",
-                        "seconds",
-                        "s",
-                        "sec",
-                    ]
-                ]
-            ):
-                termination_dict["time"] = _convert_time_to_seconds(term)
-            else:
-                raise ValueError(
-                    "Only capacity or voltage can be provided as a termination reason, "
-                    "e.g. '80% capacity', '4 Ah capacity', or '2.5 V'"
-                )
-        return termination_dict
+        # Copy the cached result so that callers cannot modify it
+        return dict(_parse_termination(tuple(termination)))
 
     def search_tag(self, tag):
         """
@@ -210,14 +245,20 @@ class Experiment:
         list
             A list of cycles in which the tag appears
         """
-        cycles = []
-        for i, cycle in enumerate(self.cycles):
-            for step in cycle:
-                if tag in step.tags:
-                    cycles.append(i)
-                    break
+        return list(self._tag_index.get(tag, []))
 
-        return cycles
+    @staticmethod
+    def _build_tag_index(steps, cycle_lengths):
+        tag_index = {}
+        steps = iter(steps)
+        for i, cycle_length in enumerate(cycle_lengths):
+            for _ in range(cycle_length):
+                for tag in next(steps).tags:
+                    cycles = tag_index.setdefault(tag, [])
+                    if not cycles or cycles[-1] != i:
+                        cycles.append(i)
+
+        return tag_index
 
     @staticmethod
     def _set_next_start_time(steps):
@@ -4,6 +4,7 @@
 import pybamm
 import numpy as np
 from datetime import datetime
+from functools import lru_cache
 from .step_termination import _read_termination
 import numbers
 
@@ -414,8 +415,13 @@ _type_to_units = {
 }
 
 
+@lru_cache(maxsize=64, typed=True)
 def _convert_time_to_seconds(time_and_units):
-    """Convert a time in seconds, minutes or hours to a time in seconds"""
+    """
+    Convert a time in seconds, minutes or hours to a time in seconds. Results are
+    cached, as the same few time strings (e.g. the default "1 minute" period) are
+    parsed for every step and experiment.
+    """
     if time_and_units is None:
         return time_and_units
 
@@ -443,8 +449,12 @@ def _convert_time_to_seconds(time_and_units):
     return time_in_seconds
 
 
+@lru_cache(maxsize=64, typed=True)
 def _convert_temperature_to_kelvin(temperature_and_units):
-    """Convert a temperature in Celsius or Kelvin to a temperature in Kelvin"""
+    """
+    Convert a temperature in Celsius or Kelvin to a temperature in Kelvin. Results
+    are cached in the same way as for :func:`_convert_time_to_seconds`.
+    """
     # If the temperature is a number, assume it is in Kelvin
     if isinstance(temperature_and_units, (int, float)) or temperature_and_units is None:
         return temperature_and_units
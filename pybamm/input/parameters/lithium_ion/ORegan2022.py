@@ -141,16 +141,12 @@ def electrolyte_transference_number_base_Landesfeind2019(c_e, T, coeffs):
     """
     c = c_e / 1000  # mol.m-3 -> mol.l
     p1, p2, p3, p4, p5, p6, p7, p8, p9 = coeffs
+    # Evaluate p1 + p2 c + p3 T + p4 c^2 + p5 c T + p6 T^2 + p7 c^3 + p8 c^2 T
+    # + p9 c T^2 in nested (Horner) form to reduce the number of multiplications
     tplus = (
         p1
-        + p2 * c
-        + p3 * T
-        + p4 * c**2
-        + p5 * c * T
-        + p6 * T**2
-        + p7 * c**3
-        + p8 * c**2 * T
-        + p9 * c * T**2
+        + c * (p2 + c * (p4 + p7 * c))
+        + T * (p3 + c * (p5 + p8 * c) + T * (p6 + p9 * c))
     )
 
     return tplus
@@ -789,6 +785,22 @@ def separator_LGM50_heat_capacity_ORegan2022(T):
     return cp_wet
 
 
+# Fitting coefficients for the EC:EMC (3:7 w:w) transference number. These are fixed,
+# so are stored once as Python floats rather than rebuilt as a numpy array on every
+# call, which also keeps numpy scalars out of the expression tree
+_transference_number_EC_EMC_3_7_coeffs = (
+    -1.28e1,
+    -6.12,
+    8.21e-2,
+    9.04e-1,
+    3.18e-2,
+    -1.27e-4,
+    1.75e-2,
+    -3.12e-3,
+    -3.96e-5,
+)
+
+
 def electrolyte_transference_number_EC_EMC_3_7_Landesfeind2019(c_e, T):
     """
     Transference number of LiPF6 in EC:EMC (3:7 w:w) as a function of ion
@@ -812,22 +824,10 @@ def electrolyte_transference_number_EC_EMC_3_7_Landesfeind2019(c_e, T):
     :class:`pybamm.Symbol`
         Electrolyte transference number
     """
-    coeffs = np.array(
-        [
-            -1.28e1,
-            -6.12,
-            8.21e-2,
-            9.04e-1,
-            3.18e-2,
-            -1.27e-4,
-            1.75e-2,
-            -3.12e-3,
-            -3.96e-5,
-        ]
+    return electrolyte_transference_number_base_Landesfeind2019(
+        c_e, T, _transference_number_EC_EMC_3_7_coeffs
     )
 
-    return electrolyte_transference_number_base_Landesfeind2019(c_e, T, coeffs)
-
 
 def electrolyte_TDF_EC_EMC_3_7_Landesfeind2019(c_e, T):
     """
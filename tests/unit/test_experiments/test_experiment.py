@@ -67,6 +67,43 @@ class TestExperiment(unittest.TestCase):
         )
         self.assertEqual(experiment.cycle_lengths, [2, 1, 1])
 
+    def test_unique_steps(self):
+        experiment = pybamm.Experiment(
+            [
+                ("Discharge at C/20 for 0.5 hours", "Charge at C/5 for 45 minutes"),
+                "Rest for 10 minutes",
+                ("Discharge at C/20 for 0.5 hours", "Charge at C/5 for 45 minutes"),
+            ]
+        )
+        self.assertEqual(
+            [step.description for step in experiment.unique_steps],
+            [
+                "Discharge at C/20 for 0.5 hours",
+                "Charge at C/5 for 45 minutes",
+                "Rest for 10 minutes",
+            ],
+        )
+        self.assertIs(experiment.steps[0], experiment.steps[3])
+
+    def test_copy(self):
+        experiment = pybamm.Experiment(
+            [("Discharge at C/20 for 0.5 hours", "Charge at C/5 for 45 minutes")],
+            period="10 seconds",
+            termination="80% capacity",
+        )
+        experiment_copy = experiment.copy()
+        self.assertIsNot(experiment_copy, experiment)
+        self.assertEqual(str(experiment_copy), str(experiment))
+        self.assertEqual(experiment_copy.steps, experiment.steps)
+        self.assertEqual(experiment_copy.period, 10)
+        self.assertEqual(experiment_copy.termination, {"capacity": (80.0, "%")})
+
+        # Containers are not shared with the original
+        experiment_copy.steps.pop()
+        experiment_copy.termination["voltage"] = (2.5, "V")
+        self.assertEqual(len(experiment.steps), 2)
+        self.assertEqual(experiment.termination, {"capacity": (80.0, "%")})
+
     def test_invalid_step_type(self):
         unprocessed = {1.0}
         period = 1
@@ -124,7 +161,31 @@ class TestExperiment(unittest.TestCase):
         )
         self.assertEqual(experiment.termination, {"capacity": (4.1, "Ah")})
 
-        with self.assertRaisesRegex(ValueError, "Only capacity"):
+        experiment = pybamm.Experiment(
+            ["Discharge at 1 C for 20 seconds"], termination=["4.1\tA.h\ncapacity"]
+        )
+        self.assertEqual(experiment.termination, {"capacity": (4.1, "Ah")})
+
+        experiment = pybamm.Experiment(
+            ["Discharge at 1 C for 20 seconds"], termination=["80%\tcapacity"]
+        )
+        self.assertEqual(experiment.termination, {"capacity": (80.0, "%")})
+
+        experiment = pybamm.Experiment(
+            ["Discharge at 1 C for 20 seconds"], termination=["2.5V"]
+        )
+        self.assertEqual(experiment.termination, {"voltage": (2.5, "V")})
+
+        experiment = pybamm.Experiment(
+            ["Discharge at 1 C for 20 seconds"],
+            termination=["80% capacity", "2.5 V", "1 hour"],
+        )
+        self.assertEqual(
+            experiment.termination,
+            {"capacity": (80.0, "%"), "voltage": (2.5, "V"), "time": 3600.0},
+        )
+
+        with self.assertRaisesRegex(ValueError, "Only capacity, voltage or time"):
             experiment = pybamm.Experiment(
                 ["Discharge at 1 C for 20 seconds"], termination="bla bla capacity bla"
             )
@@ -137,6 +198,19 @@ class TestExperiment(unittest.TestCase):
                 ["Discharge at 1 C for 20 seconds"], termination="1 capacity"
             )
 
+    def test_termination_cached_copy(self):
+        termination = ["80% capacity", "2.5 V"]
+        first = pybamm.Experiment.read_termination(termination)
+        second = pybamm.Experiment.read_termination(tuple(termination))
+        self.assertEqual(first, {"capacity": (80.0, "%"), "voltage": (2.5, "V")})
+        self.assertEqual(first, second)
+
+        # Modifying the returned dictionary should not affect later calls
+        first["capacity"] = (50.0, "%")
+        self.assertEqual(
+            pybamm.Experiment.read_termination(termination)["capacity"], (80.0, "%")
+        )
+
     def test_search_tag(self):
         s = pybamm.step.string
         experiment = pybamm.Experiment(
@@ -153,6 +227,7 @@ class TestExperiment(unittest.TestCase):
                     s("Charge at 200mW for 45 minutes", tags=["tag4"]),
                 ),
                 s("Rest for 10 minutes", tags=["tag1", "tag3", "tag4"]),
+                "Rest for 5 minutes",
             ]
         )
 
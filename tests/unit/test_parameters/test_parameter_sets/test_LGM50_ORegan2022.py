@@ -1,6 +1,7 @@
 #
 # Tests for LG M50 parameter set loads
 #
+import numpy as np
 import pytest
 import pybamm
 
@@ -59,6 +60,8 @@ class TestORegan2022:
                 [T],
                 400.8491,
             ),
+            # Electrolyte
+            "Cation transference number": ([1000, 298.15], 0.2209),
             # Separator
             "Separator specific heat capacity [J.kg-1.K-1]": (
                 [298.15],
@@ -70,3 +73,18 @@ class TestORegan2022:
             assert param.evaluate(param[name](*value[0])) == pytest.approx(
                 value[1], abs=0.0001
             )
+
+    def test_transference_number_array(self):
+        param = pybamm.ParameterValues("ORegan2022")
+        tplus = param["Cation transference number"]
+        c_e = np.linspace(100, 3000, 10)
+        T = np.array([[273.15], [298.15], [323.15]])
+
+        np.testing.assert_allclose(
+            tplus(c_e, T),
+            [
+                [param.evaluate(tplus(pybamm.Scalar(c), pybamm.Scalar(t))) for c in c_e]
+                for t in T[:, 0]
+            ],
+            rtol=1e-12,
+        )